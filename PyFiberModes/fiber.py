@@ -229,39 +229,45 @@ class Fiber(object):
 
         return layer.refractive_index
 
+    @property
+    def layers_radius_out(self) -> numpy.ndarray:
+        """
+        Returns the outer radius of all the layers as an array.
+
+        :returns:   The layers outer radius.
+        :rtype:     numpy.ndarray
+        """
+        return numpy.array([layer.radius_out for layer in self.layers])
+
+    @property
+    def layers_index(self) -> numpy.ndarray:
+        """
+        Returns the refractive index of all the layers as an array.
+
+        :returns:   The layers refractive index.
+        :rtype:     numpy.ndarray
+        """
+        return numpy.array([layer.refractive_index for layer in self.layers])
+
     @property
     def maximum_index(self) -> float:
         """
         Gets the maximum refractive index of the fiber.
 
-        :param      layer_idx:   The layer index
-        :type       layer_idx:   int
-
-        :returns:   The minimum index.
+        :returns:   The maximum index.
         :rtype:     float
         """
-        layers_maximum_index = [
-            layer.refractive_index for layer in self.layers
-        ]
-
-        return numpy.max(layers_maximum_index)
+        return self.layers_index.max()
 
     @property
     def minimum_index(self) -> float:
         """
         Gets the minimum refractive index of the fiber.
 
-        :param      layer_idx:   The layer index
-        :type       layer_idx:   int
-
         :returns:   The minimum index.
         :rtype:     float
         """
-        layers_maximum_index = [
-            layer.refractive_index for layer in self.layers
-        ]
-
-        return numpy.min(layers_maximum_index)
+        return self.layers_index.min()
 
     def get_NA(self) -> float:
         r"""
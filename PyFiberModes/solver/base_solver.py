@@ -30,40 +30,86 @@ class BaseSolver(object):
             highbound: float = None,
             ipoints: list = [],
             delta: float = 0.25,
-            maxiter: int = numpy.inf) -> float:
+            maxiter: int = numpy.inf,
+            vectorized: bool = False) -> float:
+        """
+        Finds the first root of a function starting from lowbound, scanning either
+        the given initial points or steps of size delta.
+        Returns numpy.nan if no root is found.
 
+        :param      function:       The function to evaluate
+        :type       function:       object
+        :param      function_args:  The function arguments
+        :type       function_args:  tuple
+        :param      lowbound:       The starting point of the scan
+        :type       lowbound:       float
+        :param      highbound:      The end point of the scan
+        :type       highbound:      float
+        :param      ipoints:        The points to scan, used instead of the delta steps on the first pass, the list is not modified
+        :type       ipoints:        list
+        :param      delta:          The scan step
+        :type       delta:          float
+        :param      maxiter:        The maximum number of scan steps
+        :type       maxiter:        int
+        :param      vectorized:     If True, function is evaluated once on the whole scan grid, it must accept numpy arrays
+        :type       vectorized:     bool
+
+        :returns:   The first root of the function
+        :rtype:     float
+        """
         while True:
             if ipoints:
                 maxiter = len(ipoints)
             elif highbound:
                 maxiter = int((highbound - lowbound) / delta)
 
-            a = lowbound
-            fa = function(a, *function_args)
-            if fa == 0:
-                return a
+            if vectorized and numpy.isfinite(maxiter):
+                root = self._find_first_root_on_grid(
+                    function=function,
+                    function_args=function_args,
+                    lowbound=lowbound,
+                    highbound=highbound,
+                    ipoints=ipoints,
+                    delta=delta,
+                    maxiter=maxiter
+                )
 
-            for i in range(1, maxiter + 1):
-                b = ipoints.pop(0) if ipoints else a + delta
-                if highbound:
-                    if (b > highbound > lowbound) or (b < highbound < lowbound):
+                if root is not None:
+                    return root
+
+            else:
+                a = lowbound
+                fa = function(a, *function_args)
+                if fa == 0:
+                    return a
+
+                # Direction of the scan with respect to highbound, resolved once for the whole loop
+                ascending = bool(highbound) and highbound > lowbound
+                descending = bool(highbound) and highbound < lowbound
+
+                for i in range(1, maxiter + 1):
+                    b = ipoints[i - 1] if ipoints else a + delta
+                    if (ascending and b > highbound) or (descending and b < highbound):
                         self.logger.info("find_function_first_root: no root found within allowed range")
                         return numpy.nan
 
-                fb = function(b, *function_args)
+                    fb = function(b, *function_args)
+
+                    if fb == 0:
+                        return b
 
-                if fb == 0:
-                    return b
+                    if (fa > 0 and fb < 0) or (fa < 0 and fb > 0):
+                        z = self._find_bracket_root(function=function, function_args=function_args, a=a, b=b)
 
-                if (fa > 0 and fb < 0) or (fa < 0 and fb > 0):
-                    z = brentq(function, a, b, args=function_args, xtol=1e-20)
+                        if z is not None:
+                            fz = function(z, *function_args)
+                            if abs(fa) > abs(fz) < abs(fb):  # Skip discontinuities
+                                self.logger.debug(f"skipped ({fa}, {fz}, {fb})")
+                                return z
 
-                    fz = function(z, *function_args)
-                    if abs(fa) > abs(fz) < abs(fb):  # Skip discontinuities
-                        self.logger.debug(f"skipped ({fa}, {fz}, {fb})")
-                        return z
+                    a, fa = b, fb
 
-                a, fa = b, fb
+            ipoints = []  # Initial points are only scanned on the first pass
 
             if highbound and maxiter < 100:
                 delta /= 10
@@ -73,13 +119,133 @@ class BaseSolver(object):
         self.logger.info(f"maxiter reached ({maxiter}, {lowbound}, {highbound})")
         return numpy.nan
 
+    def _find_first_root_on_grid(
+            self,
+            function,
+            function_args: tuple,
+            lowbound: float,
+            highbound: float,
+            ipoints: list,
+            delta: float,
+            maxiter: int) -> float:
+        """
+        Vectorized counterpart of the scan performed in find_function_first_root.
+        The function is evaluated in a single call on the whole scan grid, brentq is
+        then only called within the brackets where a sign change occurs.
+        Returns None if the grid was scanned without finding a root.
+
+        :param      function:       The function to evaluate, it must accept numpy arrays
+        :type       function:       object
+        :param      function_args:  The function arguments
+        :type       function_args:  tuple
+        :param      lowbound:       The starting point of the scan
+        :type       lowbound:       float
+        :param      highbound:      The end point of the scan
+        :type       highbound:      float
+        :param      ipoints:        The points to scan, used instead of the delta steps
+        :type       ipoints:        list
+        :param      delta:          The scan step
+        :type       delta:          float
+        :param      maxiter:        The number of scan steps
+        :type       maxiter:        int
+
+        :returns:   The first root of the function
+        :rtype:     float
+        """
+        if ipoints:
+            x_list = numpy.concatenate([[lowbound], ipoints])
+        else:
+            x_list = lowbound + delta * numpy.arange(maxiter + 1)
+
+        out_of_range = False
+        if highbound:
+            # Direction of the scan with respect to highbound, resolved on scalars before masking the grid
+            if highbound > lowbound:
+                out_of_range_idx = numpy.flatnonzero(x_list > highbound)
+            elif highbound < lowbound:
+                out_of_range_idx = numpy.flatnonzero(x_list < highbound)
+            else:
+                out_of_range_idx = numpy.empty(0, dtype=int)
+
+            if out_of_range_idx.size:
+                out_of_range = True
+                x_list = x_list[:out_of_range_idx[0]]
+
+        y_list = numpy.asarray(function(x_list, *function_args))
+
+        if y_list[0] == 0:
+            return x_list[0]
+
+        y_low, y_high = y_list[:-1], y_list[1:]
+
+        candidate_idx = numpy.flatnonzero((y_high == 0) | (y_low * y_high < 0))
+
+        for idx in candidate_idx:
+            fa, fb = y_low[idx], y_high[idx]
+
+            if fb == 0:
+                return x_list[idx + 1]
+
+            z = self._find_bracket_root(function=function, function_args=function_args, a=x_list[idx], b=x_list[idx + 1])
+
+            if z is None:
+                continue
+
+            fz = function(z, *function_args)
+            if abs(fa) > abs(fz) < abs(fb):  # Skip discontinuities
+                self.logger.debug(f"skipped ({fa}, {fz}, {fb})")
+                return z
+
+        if out_of_range:
+            self.logger.info("find_function_first_root: no root found within allowed range")
+            return numpy.nan
+
+        return None
+
+    def _find_bracket_root(self, function, function_args: tuple, a: float, b: float) -> float:
+        """
+        Refines the root of the function within a sign changing bracket with brentq.
+        Returns None if brentq stopped on a NaN value of the function within the bracket,
+        e.g. 0 / 0 at a pole of the equation, any other error is raised.
+
+        :param      function:       The function to evaluate
+        :type       function:       object
+        :param      function_args:  The function arguments
+        :type       function_args:  tuple
+        :param      a:              The first end of the bracket
+        :type       a:              float
+        :param      b:              The second end of the bracket
+        :type       b:              float
+
+        :returns:   The root of the function within the bracket
+        :rtype:     float
+        """
+        nan_x_list = []
+
+        def checked_function(x, *args):
+            value = function(x, *args)
+            if value != value:  # NaN
+                nan_x_list.append(x)
+            return value
+
+        try:
+            return brentq(checked_function, a, b, args=function_args, xtol=1e-20)
+
+        except ValueError:
+            if not nan_x_list:
+                raise
+
+            self.logger.info(f"find_function_first_root: skipped bracket ({a}, {b}), function is NaN at {nan_x_list[-1]}")
+            return None
+
     def get_new_x_low_x_high(
             self,
             function,
             function_args,
             x_low: float,
             x_high: float,
-            n_slice: int = 100) -> tuple:
+            n_slice: int = 100,
+            vectorized: bool = False) -> tuple:
         """
         Gets the new x boundaries.
         Returns numpy.nan if no sign inversion found.
@@ -94,6 +260,8 @@ class BaseSolver(object):
         :type       x_high:         float
         :param      n_slice:        The n iteration
         :type       n_slice:        int
+        :param      vectorized:     If True, function is evaluated once on all the slices, it must accept numpy arrays
+        :type       vectorized:     bool
 
         :returns:   The new x low x high.
         :rtype:     tuple
@@ -101,7 +269,11 @@ class BaseSolver(object):
         x_list = [x_low, x_high]
         x_list.sort()
         x_list = numpy.linspace(*x_list, n_slice)
-        y_list = [function(x, *function_args) for x in x_list]
+        if vectorized:
+            y_list = function(x_list, *function_args)
+        else:
+            y_list = [function(x, *function_args) for x in x_list]
+
         y_list = numpy.asarray(y_list)
 
         non_nan_idx = ~numpy.isnan(y_list)
@@ -134,7 +306,8 @@ class BaseSolver(object):
             x_high: float,
             function_args: tuple = (),
             max_iteration: int = 100,
-            tolerance: float = 1e-8) -> float:
+            tolerance: float = 1e-8,
+            vectorized: bool = False) -> float:
         """
         Finds and return the root of a given function within range.
 
@@ -148,18 +321,21 @@ class BaseSolver(object):
         :type       function_args:  tuple
         :param      max_iteration:  The maximum iteration
         :type       max_iteration:  int
+        :param      tolerance:      The tolerance on the root
+        :type       tolerance:      float
+        :param      vectorized:     If True, function must accept numpy arrays and is evaluated once on the bracketing grid
+        :type       vectorized:     bool
 
         :returns:   The root of the function
         :rtype:     float
         """
-        y_low, y_high = function(x_low, *function_args), function(x_high, *function_args)
-
         boundaries = self.get_new_x_low_x_high(
             function=function,
             function_args=function_args,
             x_low=x_low,
             x_high=x_high,
             n_slice=100,
+            vectorized=vectorized
         )
 
         if numpy.isscalar(boundaries) and numpy.isnan(boundaries):
@@ -2,13 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import numpy
-from scipy.special import kn, kvp, k0, k1, jn, jvp, yn, yvp, iv, ivp
+from scipy.special import kn, kvp, kve, k0, k1, jn, jvp, yn, yvp, iv, ivp
 from scipy.constants import mu_0, epsilon_0, physical_constants
 
 from PyFiberModes.solver.base_solver import BaseSolver
 from PyFiberModes.mode import Mode
+from PyFiberModes.stepindex import get_bessel_terms_function
 
 eta0 = physical_constants['characteristic impedance of vacuum'][0]
+Y0 = numpy.sqrt(epsilon_0 / mu_0)
 
 
 class NameSpace():
@@ -174,7 +176,7 @@ class NeffSolver(BaseSolver):
             C=C
         )
 
-        hy = neff * numpy.sqrt(epsilon_0 / mu_0) * ex
+        hy = neff * Y0 * ex
 
         e_field = numpy.array((ex, 0, 0))
         h_field = numpy.array((0, hy, 0))
@@ -265,7 +267,7 @@ class NeffSolver(BaseSolver):
             C=C
         )
 
-        hy = neff * numpy.sqrt(epsilon_0 / mu_0) * ex
+        hy = neff * Y0 * ex
 
         e_field = numpy.array((ex, 0, 0))
         h_field = numpy.array((0, hy, 0))
@@ -327,7 +329,7 @@ class NeffSolver(BaseSolver):
                     radius_out=radius_out,
                     neff=neff,
                     EH=EH,
-                    c=numpy.sqrt(epsilon_0 / mu_0) * n**2,
+                    c=Y0 * n**2,
                     idx=(0, 3)
                 )
 
@@ -343,7 +345,7 @@ class NeffSolver(BaseSolver):
                 F3 = ivp(nu, u) / iv(nu, u)
                 F4 = kvp(nu, u) / kn(nu, u)
 
-            c4 = numpy.sqrt(epsilon_0 / mu_0) * n * n * c1
+            c4 = Y0 * n * n * c1
 
             EH[0] = C[0] + C[1]
             EH[3] = c4 * (F3 * C[0] + F4 * C[1])
@@ -405,23 +407,20 @@ class NeffSolver(BaseSolver):
         c1 = rho / u
         c2 = self.wavelength.k0 * c1
         c3 = nu * c1 / radius if radius else 0  # To avoid div by 0
-        c6 = numpy.sqrt(epsilon_0 / mu_0) * layer.refractive_index**2
-
-        if neff < layer.refractive_index:
-            B1 = jn(nu, u)
-            B2 = yn(nu, u)
-            F1 = jn(nu, urp) / B1
-            F2 = yn(nu, urp) / B2 if layer.radius_in > 0 else 0
-            F3 = jvp(nu, urp) / B1
-            F4 = yvp(nu, urp) / B2 if layer.radius_in > 0 else 0
-        else:
+        c6 = Y0 * layer.refractive_index**2
+
+        oscillatory = neff < layer.refractive_index
+        if not oscillatory:
             c2 = -c2
-            B1 = iv(nu, u)
-            B2 = kn(nu, u)
-            F1 = iv(nu, urp) / B1
-            F2 = kn(nu, urp) / B2 if layer.radius_in > 0 else 0
-            F3 = ivp(nu, urp) / B1
-            F4 = kvp(nu, urp) / B2 if layer.radius_in > 0 else 0
+
+        get_terms = get_bessel_terms_function(nu, oscillatory)
+        B1, _, B2, _ = get_terms(u)
+        J, dJ, Y, dY = get_terms(urp)
+
+        F1 = J / B1
+        F2 = Y / B2 if layer.radius_in > 0 else 0
+        F3 = dJ / B1
+        F4 = dY / B2 if layer.radius_in > 0 else 0
 
         A, B, Ap, Bp = layer.C[:, 0] + layer.C[:, 1] * self.alpha
 
@@ -533,7 +532,7 @@ class NeffSolver(BaseSolver):
 
         F4 = k1(u) / k0(u)
 
-        return Hp - self.wavelength.k0 * self.fiber.last_layers.radius_in / u * numpy.sqrt(epsilon_0 / mu_0) * self.fiber.last_layers.refractive_index**2 * Ez * F4
+        return Hp - self.wavelength.k0 * self.fiber.last_layers.radius_in / u * Y0 * self.fiber.last_layers.refractive_index**2 * Ez * F4
 
     def get_HE_equation(self, neff: float, nu: int) -> float:
         EH = numpy.empty((4, 2))
@@ -549,8 +548,7 @@ class NeffSolver(BaseSolver):
 
         # Last layer
         C = numpy.zeros((4, 2))
-        C[1, :] = EH[0, :]
-        C[3, :] = EH[1, :]
+        C[1::2] = EH[:2]
 
         last_layer = self.fiber.layers[-1]
 
@@ -561,11 +559,13 @@ class NeffSolver(BaseSolver):
             neff=neff,
         )
 
-        F4 = kvp(nu, u) / kn(nu, u)
+        # K'/K from the nu -/+ 1 recurrences, the exponential scaling of kve cancels in the ratio
+        k_m, k_p = kve((nu - 1, nu + 1), u)
+        F4 = -nu * (k_m + k_p) / (u * (k_p - k_m))
         c1 = -self.wavelength.k0 * last_layer.radius_in / u
         c2 = neff * nu / u * c1
         c3 = eta0 * c1
-        c4 = numpy.sqrt(epsilon_0 / mu_0) * last_layer.refractive_index**2 * c1
+        c4 = Y0 * last_layer.refractive_index**2 * c1
 
         E = EH[2, :] - (c2 * EH[0, :] - c3 * F4 * EH[1, :])
         H = EH[3, :] - (c4 * F4 * EH[0, :] - c2 * EH[1, :])
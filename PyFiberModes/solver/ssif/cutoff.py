@@ -101,7 +101,8 @@ class CutoffSolver(BaseSolver):
             function_args=(mode.nu,),
             lowbound=lower_neff_boundary,
             ipoints=ipoints,
-            delta=delta
+            delta=delta,
+            vectorized=True
         )
 
         if numpy.isnan(cutoff):
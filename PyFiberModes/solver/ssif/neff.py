@@ -147,7 +147,8 @@ class NeffSolver(BaseSolver):
             x_low=lower_neff_boundary + epsilon,
             x_high=n_clad_equivalent - epsilon,
             function_args=(mode.nu, ),
-            max_iteration=max_iteration
+            max_iteration=max_iteration,
+            vectorized=True
         )
 
         return result
@@ -190,7 +191,7 @@ class NeffSolver(BaseSolver):
         else:
             ex = k0(w * radius / core.radius_out) / k0(w)
 
-        hy = neff * numpy.sqrt(epsilon_0 / mu_0) * ex  # Snyder & Love uses nco, but Bures uses neff
+        hy = neff * Y0 * ex  # Snyder & Love uses nco, but Bures uses neff
 
         e_field = numpy.array((ex, 0, 0))
         h_field = numpy.array((0, hy, 0))
@@ -237,13 +238,13 @@ class NeffSolver(BaseSolver):
         ratio = radius / core.radius_out
 
         if radius < core.radius_out:
-            hz = -numpy.sqrt(epsilon_0 / mu_0) * u / term_0 * j0(u * ratio) / j1(u)
+            hz = -Y0 * u / term_0 * j0(u * ratio) / j1(u)
             ephi = -j1(u * ratio) / j1(u)
         else:
-            hz = numpy.sqrt(epsilon_0 / mu_0) * w / term_0 * k0(w * ratio) / k1(w)
+            hz = Y0 * w / term_0 * k0(w * ratio) / k1(w)
             ephi = -k1(w * ratio) / k1(w)
 
-        hr = -neff * numpy.sqrt(epsilon_0 / mu_0) * ephi
+        hr = -neff * Y0 * ephi
 
         e_field = numpy.array((0, ephi, 0))
         h_field = numpy.array((hr, 0, hz))
@@ -301,11 +302,11 @@ class NeffSolver(BaseSolver):
         if radius < rho:
             ez = -u / (k * neff * rho) * j0(u * radius_ratio) / j1(u)
             er = j1(u * radius_ratio) / j1(u)
-            hphi = numpy.sqrt(epsilon_0 / mu_0) * n_core / neff * er
+            hphi = Y0 * n_core / neff * er
         else:
             ez = index_ratio * w / (k * neff * rho) * k0(w * radius_ratio) / k1(w)
             er = index_ratio * k1(w * radius_ratio) / k1(w)
-            hphi = numpy.sqrt(epsilon_0 / mu_0) * index_ratio * k1(w * radius_ratio) / k1(w)
+            hphi = Y0 * index_ratio * k1(w * radius_ratio) / k1(w)
 
         e_field = numpy.array((er, 0, ez))
         h_field = numpy.array((0, hphi, 0))
@@ -517,11 +518,18 @@ class NeffSolver(BaseSolver):
         n_clad = clad.refractive_index
 
         delta = (1 - n_clad**2 / n_core**2) / 2
-        jnu = jn(nu, U)
-        knu = kn(nu, W)
-        kp = kvp(nu, W)
 
-        term_0 = jvp(nu, U) * W * knu + kp * U * jnu * (1 - delta)
+        # Orders nu and derivatives from the nu -/+ 1 recurrences: the whole neff grid is
+        # evaluated with four Bessel calls instead of six.
+        j_m, j_p = jn(nu - 1, U), jn(nu + 1, U)
+        k_m, k_p = kn(nu - 1, W), kn(nu + 1, W)
+
+        jnu = U / (2 * nu) * (j_m + j_p)
+        jp = (j_m - j_p) / 2
+        knu = W / (2 * nu) * (k_p - k_m)
+        kp = -(k_m + k_p) / 2
+
+        term_0 = jp * W * knu + kp * U * jnu * (1 - delta)
         term_1 = (nu * neff * V**2 * knu)
         term_2 = n_core * U * W
         term_3 = U * kp * delta
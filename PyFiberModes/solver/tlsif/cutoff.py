@@ -95,24 +95,21 @@ class CutoffSolver(BaseSolver):
         :returns:   The computed parameters
         :rtype:     tuple
         """
-        r1 = self.fiber.layers[0].radius_out
-        r2 = self.fiber.layers[1].radius_out
+        r1, r2, _ = self.fiber.layers_radius_out
 
         wavelength = get_wavelength_from_V0(fiber=self.fiber, V0=V0)
 
         if numpy.isinf(wavelength):
             wavelength = Wavelength(k0=1)  # because it causes troubles if 0
 
-        layers_minimum_index_squared = [
-            layer.refractive_index**2 for layer in self.fiber.layers
-        ]
+        layers_index_squared = self.fiber.layers_index**2
 
-        n1sq, n2sq, n3sq = layers_minimum_index_squared
+        n1sq, n2sq, n3sq = layers_index_squared
 
         if wavelength == 0:  # Avoid floating point error. But there should be a way to do it better.
-            Usq = [numpy.inf, numpy.inf, numpy.inf]
+            Usq = numpy.full(3, numpy.inf)
         else:
-            Usq = [wavelength.k0**2 * (nsq - n3sq) for nsq in layers_minimum_index_squared]
+            Usq = wavelength.k0**2 * (layers_index_squared - n3sq)
 
         s1, s2, s3 = numpy.sign(Usq)
         u1, u2, u3 = numpy.sqrt(numpy.abs(Usq))
@@ -3,14 +3,299 @@
 
 import numpy
 from dataclasses import dataclass
+from functools import lru_cache
 
-from scipy.special import jn, yn, iv, kn
-from scipy.special import j0, y0, i0, k0
-from scipy.special import j1, y1, i1, k1
-from scipy.special import jvp, yvp, ivp, kvp
+from scipy.special import jv, yv, iv, kv, j0, j1, y0, y1, i0, i1, k0, k1
 from scipy.constants import mu_0, epsilon_0, physical_constants
 
 eta0 = physical_constants['characteristic impedance of vacuum'][0]
+Y0 = numpy.sqrt(epsilon_0 / mu_0)
+
+# Field solutions of a layer, indexed by oscillatory = neff < layer index:
+# the (first kind, second kind) Bessel functions, the sign of the field coefficients
+# and the Wronskian normalization of the LP constants.
+BESSEL_FUNCTIONS = {True: (jv, yv), False: (iv, kv)}
+FIELD_SIGN = {True: 1, False: -1}
+LP_FACTOR = {True: numpy.pi / 2, False: 1}
+
+# Dedicated order 0 and 1 (first kind, second kind) functions, used for nu = 0 where
+# the derivatives reduce to J0' = -J1, Y0' = -Y1, I0' = I1 and K0' = -K1.
+ORDER_ZERO_BESSEL_FUNCTIONS = {True: (j0, j1, y0, y1), False: (i0, i1, k0, k1)}
+
+
+@lru_cache(maxsize=None)
+def get_bessel_terms_function(nu: int, oscillatory: bool):
+    """
+    Returns the evaluation of get_bessel_terms specialized for a fixed order and family.
+    The Bessel functions, the orders of the table, the sign of the recurrences and the
+    choice between the direct evaluation and the recurrence are resolved once here,
+    the returned function only depends on u.
+
+    :param      nu:           The order of the Bessel functions
+    :type       nu:           int
+    :param      oscillatory:  If True uses (J, Y) family else (I, K) family
+    :type       oscillatory:  bool
+
+    :returns:   The function of u returning the Bessel terms.
+    :rtype:     object
+    """
+    first_kind, second_kind = BESSEL_FUNCTIONS[oscillatory]
+    sign = FIELD_SIGN[oscillatory]
+    direct_orders = (nu - 1, nu, nu + 1)
+
+    def get_direct_terms(u: float) -> tuple:
+        F_m, F, F_p = first_kind(direct_orders, u)
+        G_m, G, G_p = second_kind(direct_orders, u)
+
+        return F, (F_m - sign * F_p) / 2, G, sign * (G_m - sign * G_p) / 2
+
+    if nu == 0:
+        first_kind_0, first_kind_1, second_kind_0, second_kind_1 = ORDER_ZERO_BESSEL_FUNCTIONS[oscillatory]
+
+        def get_order_zero_terms(u: float) -> tuple:
+            return first_kind_0(u), -sign * first_kind_1(u), second_kind_0(u), -second_kind_1(u)
+
+        return get_order_zero_terms
+
+    recurrence_orders = (nu - 1, nu + 1)
+    two_nu = 2 * nu
+
+    def get_recurrence_terms(u: float) -> tuple:
+        if u == 0:
+            return get_direct_terms(u)
+
+        F_m, F_p = first_kind(recurrence_orders, u)
+        G_m, G_p = second_kind(recurrence_orders, u)
+
+        ratio = u / two_nu
+        F = ratio * (F_m + sign * F_p)
+        G = sign * ratio * (G_m + sign * G_p)
+
+        return F, (F_m - sign * F_p) / 2, G, sign * (G_m - sign * G_p) / 2
+
+    return get_recurrence_terms
+
+
+@lru_cache(maxsize=4096)
+def get_bessel_terms(nu: int, u: float, oscillatory: bool) -> tuple:
+    r"""
+    Returns the Bessel functions of order nu, and their derivatives, evaluated at u.
+    The oscillatory solutions (J, Y) are used inside a layer where neff is lower than
+    the layer index, the evanescent ones (I, K) otherwise.
+
+    Only the orders nu - 1 and nu + 1 are evaluated, the order nu and the derivatives
+    are obtained from the recurrence relations:
+
+    .. math::
+        J_\nu = \frac{u}{2 \nu} (J_{\nu-1} + J_{\nu+1}) \quad & J'_\nu = (J_{\nu-1} - J_{\nu+1}) / 2 \\
+        Y_\nu = \frac{u}{2 \nu} (Y_{\nu-1} + Y_{\nu+1}) \quad & Y'_\nu = (Y_{\nu-1} - Y_{\nu+1}) / 2 \\
+        I_\nu = \frac{u}{2 \nu} (I_{\nu-1} - I_{\nu+1}) \quad & I'_\nu = (I_{\nu-1} + I_{\nu+1}) / 2 \\
+        K_\nu = \frac{u}{2 \nu} (K_{\nu+1} - K_{\nu-1}) \quad & K'_\nu = -(K_{\nu-1} + K_{\nu+1}) / 2
+
+    The order nu is evaluated directly when u is zero, as the first relations do not hold,
+    and through the dedicated order 0 and 1 functions when nu is zero.
+
+    Results are memoized as the same (nu, u) pairs are evaluated many times by the
+    different layer methods during a single root-finding iteration.
+
+    :param      nu:           The order of the Bessel functions
+    :type       nu:           int
+    :param      u:            The argument of the Bessel functions
+    :type       u:            float
+    :param      oscillatory:  If True returns (J, Y) family else (I, K) family
+    :type       oscillatory:  bool
+
+    :returns:   The first kind, its derivative, the second kind and its derivative.
+    :rtype:     tuple
+    """
+    return get_bessel_terms_function(nu, oscillatory)(u)
+
+
+def solve_V_system(
+        F1: float,
+        F2: float,
+        F3: float,
+        F4: float,
+        c2: float,
+        c3: float,
+        c4: float,
+        EH: numpy.ndarray,
+        out: numpy.ndarray = None) -> numpy.ndarray:
+    r"""
+    Solves the 4x4 boundary matching system of the hybrid modes constants:
+
+    .. math::
+        \begin{bmatrix}
+            F_1 & F_2 & 0 & 0 \\
+            0 & 0 & F_1 & F_2 \\
+            F_1 c_2 & F_2 c_2 & -F_3 c_3 & -F_4 c_3 \\
+            F_3 c_4 & F_4 c_4 & -F_1 c_2 & -F_2 c_2
+        \end{bmatrix} C = EH
+
+    Substituting the first two rows into the last two, the system decouples into two
+    2x2 systems sharing the matrix [[F1, F2], [F3, F4]], which are solved in closed form.
+
+    :param      F1:   The first kind Bessel ratio
+    :type       F1:   float
+    :param      F2:   The second kind Bessel ratio
+    :type       F2:   float
+    :param      F3:   The first kind Bessel derivative ratio
+    :type       F3:   float
+    :param      F4:   The second kind Bessel derivative ratio
+    :type       F4:   float
+    :param      c2:   The coupling coefficient between E and H fields
+    :type       c2:   float
+    :param      c3:   The E field derivative coefficient
+    :type       c3:   float
+    :param      c4:   The H field derivative coefficient
+    :type       c4:   float
+    :param      EH:   The right hand side, either of shape (4,) or (4, n)
+    :type       EH:   numpy.ndarray
+    :param      out:  The buffer, of the same shape as EH, in which the constants are written
+    :type       out:  numpy.ndarray
+
+    :returns:   The constants C, with the same shape as EH.
+    :rtype:     numpy.ndarray
+    """
+    if out is None:
+        out = numpy.empty(numpy.shape(EH))
+
+    determinant = F1 * F4 - F2 * F3
+
+    E_derivative = (c2 * EH[0] - EH[2]) / c3
+    H_derivative = (EH[3] + c2 * EH[1]) / c4
+
+    out[0] = (F4 * EH[0] - F2 * H_derivative) / determinant
+    out[1] = (F1 * H_derivative - F3 * EH[0]) / determinant
+    out[2] = (F4 * EH[1] - F2 * E_derivative) / determinant
+    out[3] = (F1 * E_derivative - F3 * EH[1]) / determinant
+
+    return out
+
+
+def solve_TE_TM_system(
+        F1: float,
+        F2: float,
+        F3: float,
+        F4: float,
+        c3: float,
+        EH: numpy.ndarray,
+        out: numpy.ndarray = None) -> numpy.ndarray:
+    r"""
+    Solves, in closed form, the 2x2 boundary matching system of the TE or TM modes constants:
+
+    .. math::
+        \begin{bmatrix}
+            F_1 & F_2 \\
+            F_3 c_3 & F_4 c_3
+        \end{bmatrix} C = EH
+
+    :param      F1:   The first kind Bessel ratio
+    :type       F1:   float
+    :param      F2:   The second kind Bessel ratio
+    :type       F2:   float
+    :param      F3:   The first kind Bessel derivative ratio
+    :type       F3:   float
+    :param      F4:   The second kind Bessel derivative ratio
+    :type       F4:   float
+    :param      c3:   The field derivative coefficient
+    :type       c3:   float
+    :param      EH:   The right hand side of shape (2,)
+    :type       EH:   numpy.ndarray
+    :param      out:  The buffer of shape (2,) in which the constants are written
+    :type       out:  numpy.ndarray
+
+    :returns:   The constants C.
+    :rtype:     numpy.ndarray
+    """
+    if out is None:
+        out = numpy.empty(2)
+
+    determinant = c3 * (F1 * F4 - F2 * F3)
+
+    out[0] = (F4 * c3 * EH[0] - F2 * EH[1]) / determinant
+    out[1] = (F1 * EH[1] - F3 * c3 * EH[0]) / determinant
+
+    return out
+
+
+def get_psi_from_bessel_terms(
+        u: float,
+        C0: float,
+        C1: float,
+        B1: float,
+        dB1: float,
+        B2: float,
+        dB2: float) -> tuple:
+    r"""
+    Combines the precomputed Bessel terms into the :math:`\psi` function and its derivative.
+    The second kind terms are skipped when C1 is null, as they diverge at the fiber center.
+
+    :param      u:    The U (or W) parameter at which the Bessel terms were evaluated
+    :type       u:    float
+    :param      C0:   The first kind constant
+    :type       C0:   float
+    :param      C1:   The second kind constant
+    :type       C1:   float
+    :param      B1:   The first kind Bessel function
+    :type       B1:   float
+    :param      dB1:  The first kind Bessel function derivative
+    :type       dB1:  float
+    :param      B2:   The second kind Bessel function
+    :type       B2:   float
+    :param      dB2:  The second kind Bessel function derivative
+    :type       dB2:  float
+
+    :returns:   A tuple with psi (:math:`\psi`) and the derivative of psi (:math:`\dot{\psi}`)
+    :rtype:     tuple
+    """
+    if C1:
+        return C0 * B1 + C1 * B2, u * C0 * dB1 + C1 * dB2
+
+    return C0 * B1, u * C0 * dB1
+
+
+def get_EH_from_constants(
+        C: numpy.ndarray,
+        F3: float,
+        F4: float,
+        c2: float,
+        c3: float,
+        c4: float,
+        EH: numpy.ndarray) -> numpy.ndarray:
+    """
+    Assembles the EH field components at the outer boundary of a layer from its constants.
+    The components are written in place into EH, which is of the same shape as C.
+
+    :param      C:    The layer constants, either of shape (4,) or (4, n)
+    :type       C:    numpy.ndarray
+    :param      F3:   The first kind Bessel derivative ratio
+    :type       F3:   float
+    :param      F4:   The second kind Bessel derivative ratio
+    :type       F4:   float
+    :param      c2:   The coupling coefficient between E and H fields
+    :type       c2:   float
+    :param      c3:   The E field derivative coefficient
+    :type       c3:   float
+    :param      c4:   The H field derivative coefficient
+    :type       c4:   float
+    :param      EH:   The EH field buffer
+    :type       EH:   numpy.ndarray
+
+    :returns:   The EH field
+    :rtype:     numpy.ndarray
+    """
+    C0, C1, C2, C3 = C
+
+    E = C0 + C1
+    H = C2 + C3
+
+    EH[0] = E
+    EH[1] = H
+    EH[2] = c2 * E - c3 * (F3 * C2 + F4 * C3)
+    EH[3] = c4 * (F3 * C0 + F4 * C1) - c2 * H
+
+    return EH
 
 
 @dataclass
@@ -34,6 +319,12 @@ class Geometry(object):
 class StepIndex(Geometry):
     DEFAULT_PARAMS = []
 
+    def __post_init__(self):
+        super().__post_init__()
+        # Constants buffers reused by EH_fields for the TE/TM (4,) and hybrid (4, 2) modes
+        self._C4 = numpy.zeros(4)
+        self._C42 = numpy.zeros((4, 2))
+
     def get_index_at_radius(self, radius: float) -> float:
         """
         Gets the index of the local layer at a given radius.
@@ -68,11 +359,28 @@ class StepIndex(Geometry):
         :returns:   The u parameter at given radius.
         :rtype:     float
         """
+        U = numpy.sqrt(self.get_U_W_parameter_squared(radius=radius, neff=neff))
+
+        return U
+
+    def get_U_W_parameter_squared(self, radius: float, neff: float) -> float:
+        r"""
+        Gets the squared u parameter, i.e. :math:`U^2` in the core and
+        :math:`W^2` in the clad, without evaluating the square root.
+
+        :param      radius:      The radius
+        :type       radius:      float
+        :param      neff:        The neff
+        :type       neff:        float
+
+        :returns:   The squared u parameter at given radius.
+        :rtype:     float
+        """
         index = self.get_index_at_radius(radius=radius)
 
-        U = self.wavelength.k0 * radius * numpy.sqrt(abs(index**2 - neff**2))
+        U_squared = (self.wavelength.k0 * radius)**2 * abs(index**2 - neff**2)
 
-        return U
+        return U_squared
 
     def get_psi(self, radius: float, neff: float, nu: int, C: list) -> tuple:
         r"""
@@ -103,25 +411,10 @@ class StepIndex(Geometry):
             neff=neff,
         )
 
-        layer_max_index = self.refractive_index
-
-        if neff < layer_max_index:
-            if C[1]:
-                psi = C[0] * jn(nu, u) + C[1] * yn(nu, u)
-                psip = u * C[0] * jvp(nu, u) + C[1] * yvp(nu, u)
-            else:
-                psi = C[0] * jn(nu, u)
-                psip = u * C[0] * jvp(nu, u)
-
-        else:
-            if C[1]:
-                psi = C[0] * iv(nu, u) + C[1] * kn(nu, u)
-                psip = u * C[0] * ivp(nu, u) + C[1] * kvp(nu, u)
-            else:
-                psi = C[0] * iv(nu, u)
-                psip = u * C[0] * ivp(nu, u)
+        # Psi is evaluated at arbitrary radii, the specialized function bypasses the memoization
+        B1, dB1, B2, dB2 = get_bessel_terms_function(nu, neff < self.refractive_index)(u)
 
-        return psi, psip
+        return get_psi_from_bessel_terms(u=u, C0=C[0], C1=C[1], B1=B1, dB1=dB1, B2=B2, dB2=dB2)
 
     def get_LP_constants(self,
             radius: float,
@@ -134,13 +427,14 @@ class StepIndex(Geometry):
             neff=neff,
         )
 
-        if neff < self.refractive_index:
-            term_0 = numpy.pi / 2 * (u * yvp(nu, u) * A[0] - yn(nu, u) * A[1])
-            term_1 = numpy.pi / 2 * (jn(nu, u) * A[1] - u * jvp(nu, u) * A[0])
+        oscillatory = neff < self.refractive_index
 
-        else:
-            term_0 = u * kvp(nu, u) * A[0] - kn(nu, u) * A[1]
-            term_1 = iv(nu, u) * A[1] - u * ivp(nu, u) * A[0]
+        B1, dB1, B2, dB2 = get_bessel_terms(nu, u, oscillatory)
+
+        factor = LP_FACTOR[oscillatory]
+
+        term_0 = factor * (u * dB2 * A[0] - B2 * A[1])
+        term_1 = factor * (B1 * A[1] - u * dB1 * A[0])
 
         return term_0, term_1
 
@@ -170,123 +464,104 @@ class StepIndex(Geometry):
         :returns:   The EH field
         :rtype:     list
         """
-        u = self.get_U_W_parameter(radius=radius_out, neff=neff)
+        u_squared = self.get_U_W_parameter_squared(radius=radius_out, neff=neff)
+        u = numpy.sqrt(u_squared)
+
+        self.C = C = self._C4 if nu == 0 else self._C42
 
         if radius_in == 0:
+            C.fill(0)
             if nu == 0:
-                if TM:
-                    self.C = numpy.array([1., 0., 0., 0.])
-                else:
-                    self.C = numpy.array([0., 0., 1., 0.])
+                C[0 if TM else 2] = 1
             else:
-                self.C = numpy.zeros((4, 2))
-                self.C[0, 0] = 1  # Ez = 1
-                self.C[2, 1] = 1  # Hz = alpha
+                C[0, 0] = 1  # Ez = 1
+                C[2, 1] = 1  # Hz = alpha
 
         elif nu == 0:
-            self.C = numpy.zeros(4)
+            C.fill(0)
             if TM:
-                c = numpy.sqrt(epsilon_0 / mu_0) * self.refractive_index**2
+                c = Y0 * self.refractive_index**2
                 idx = (0, 3)
 
-                self.C[:2] = self.get_TE_TM_constants(
+                self.get_TE_TM_constants(
                     radius_in=radius_in,
                     radius_out=radius_out,
                     neff=neff,
                     EH=EH,
                     c=c,
-                    idx=idx
+                    idx=idx,
+                    out=C[:2]
                 )
             else:
                 c = -eta0
                 idx = (1, 2)
 
-                self.C[2:] = self.get_TE_TM_constants(
+                self.get_TE_TM_constants(
                     radius_in=radius_in,
                     radius_out=radius_out,
                     neff=neff,
                     EH=EH,
                     c=c,
-                    idx=idx
+                    idx=idx,
+                    out=C[2:]
                 )
         else:
-            self.C = self.get_V_constant(
+            self.get_V_constant(
                 radius_in=radius_in,
                 radius_out=radius_out,
                 neff=neff,
                 nu=nu,
-                EH=EH
+                EH=EH,
+                out=C
             )
 
         # Compute EH fields
-        if neff < self.refractive_index:
-            c1 = self.wavelength.k0 * radius_out / u
-            F3 = jvp(nu, u) / jn(nu, u)
-            F4 = yvp(nu, u) / yn(nu, u)
-        else:
-            c1 = -self.wavelength.k0 * radius_out / u
-            F3 = ivp(nu, u) / iv(nu, u)
-            F4 = kvp(nu, u) / kn(nu, u)
+        oscillatory = neff < self.refractive_index
 
-        c2 = neff * nu / u * c1
-        c3 = eta0 * c1
-        c4 = numpy.sqrt(epsilon_0 / mu_0) * self.refractive_index**2 * c1
+        B1, dB1, B2, dB2 = get_bessel_terms(nu, u, oscillatory)
+
+        F3 = dB1 / B1
+        F4 = dB2 / B2
 
-        EH[0] = self.C[0] + self.C[1]
-        EH[1] = self.C[2] + self.C[3]
-        EH[2] = (c2 * (self.C[0] + self.C[1]) - c3 * (F3 * self.C[2] + F4 * self.C[3]))
-        EH[3] = (c4 * (F3 * self.C[0] + F4 * self.C[1]) - c2 * (self.C[2] + self.C[3]))
+        sign_k0_radius = FIELD_SIGN[oscillatory] * self.wavelength.k0 * radius_out
+        c1 = sign_k0_radius / u
 
-        return EH
+        c2 = neff * nu * sign_k0_radius / u_squared
+        c3 = eta0 * c1
+        c4 = Y0 * self.refractive_index**2 * c1
+
+        return get_EH_from_constants(C=self.C, F3=F3, F4=F4, c2=c2, c3=c3, c4=c4, EH=EH)
 
     def get_V_constant(self,
             radius_in: float,
             radius_out: float,
             neff: float,
             nu,
-            EH) -> float:
-
-        a = numpy.zeros((4, 4))
+            EH,
+            out: numpy.ndarray = None) -> float:
 
         u = self.get_U_W_parameter(radius=radius_out, neff=neff)
 
-        urp = self.get_U_W_parameter(radius=radius_in, neff=neff)
+        # Same layer and same neff: U scales linearly with the radius
+        urp = u * radius_in / radius_out
 
-        if neff < self.refractive_index:
-            B1 = jn(nu, u)
-            B2 = yn(nu, u)
-            F1 = jn(nu, urp) / B1
-            F2 = yn(nu, urp) / B2
-            F3 = jvp(nu, urp) / B1
-            F4 = yvp(nu, urp) / B2
-            c1 = self.wavelength.k0 * radius_out / u
-        else:
-            B1 = iv(nu, u)
-            B2 = kn(nu, u)
-            F1 = iv(nu, urp) / B1 if u else 1
-            F2 = kn(nu, urp) / B2
-            F3 = ivp(nu, urp) / B1 if u else 1
-            F4 = kvp(nu, urp) / B2
-            c1 = -self.wavelength.k0 * radius_out / u
+        oscillatory = neff < self.refractive_index
+
+        B1, _, B2, _ = get_bessel_terms(nu, u, oscillatory)
+        J, dJ, Y, dY = get_bessel_terms(nu, urp, oscillatory)
+
+        F1 = J / B1 if u else 1
+        F2 = Y / B2
+        F3 = dJ / B1 if u else 1
+        F4 = dY / B2
+
+        c1 = FIELD_SIGN[oscillatory] * self.wavelength.k0 * radius_out / u
 
         c2 = neff * nu / urp * c1
         c3 = eta0 * c1
-        c4 = numpy.sqrt(epsilon_0 / mu_0) * self.refractive_index**2 * c1
-
-        a[0, 0] = F1
-        a[0, 1] = F2
-        a[1, 2] = F1
-        a[1, 3] = F2
-        a[2, 0] = F1 * c2
-        a[2, 1] = F2 * c2
-        a[2, 2] = -F3 * c3
-        a[2, 3] = -F4 * c3
-        a[3, 0] = F3 * c4
-        a[3, 1] = F4 * c4
-        a[3, 2] = -F1 * c2
-        a[3, 3] = -F2 * c2
-
-        return numpy.linalg.solve(a, EH)
+        c4 = Y0 * self.refractive_index**2 * c1
+
+        return solve_V_system(F1=F1, F2=F2, F3=F3, F4=F4, c2=c2, c3=c3, c4=c4, EH=EH, out=out)
 
     def get_TE_TM_constants(self,
             radius_in: float,
@@ -294,42 +569,30 @@ class StepIndex(Geometry):
             neff: float,
             EH,
             c,
-            idx) -> float:
-
-        a = numpy.empty((2, 2))
+            idx,
+            out: numpy.ndarray = None) -> float:
 
         u = self.get_U_W_parameter(
             radius=radius_out,
             neff=neff,
         )
 
-        urp = self.get_U_W_parameter(
-            radius=radius_in,
-            neff=neff,
-        )
+        # Same layer and same neff: U scales linearly with the radius
+        urp = u * radius_in / radius_out
 
-        if neff < self.refractive_index:
-            B1 = j0(u)
-            B2 = y0(u)
-            F1 = j0(urp) / B1
-            F2 = y0(urp) / B2
-            F3 = -j1(urp) / B1
-            F4 = -y1(urp) / B2
-            c1 = self.wavelength.k0 * radius_out / u
-        else:
-            B1 = i0(u)
-            B2 = k0(u)
-            F1 = i0(urp) / B1
-            F2 = k0(urp) / B2
-            F3 = i1(urp) / B1
-            F4 = -k1(urp) / B2
-            c1 = -self.wavelength.k0 * radius_out / u
+        oscillatory = neff < self.refractive_index
 
-        c3 = c * c1
+        # Derivatives of order 0: J0' = -J1, Y0' = -Y1, I0' = I1, K0' = -K1
+        B1, _, B2, _ = get_bessel_terms(0, u, oscillatory)
+        J, dJ, Y, dY = get_bessel_terms(0, urp, oscillatory)
+
+        F1 = J / B1
+        F2 = Y / B2
+        F3 = dJ / B1
+        F4 = dY / B2
 
-        a[0, 0] = F1
-        a[0, 1] = F2
-        a[1, 0] = F3 * c3
-        a[1, 1] = F4 * c3
+        c1 = FIELD_SIGN[oscillatory] * self.wavelength.k0 * radius_out / u
+
+        c3 = c * c1
 
-        return numpy.linalg.solve(a, EH.take(idx))
+        return solve_TE_TM_system(F1=F1, F2=F2, F3=F3, F4=F4, c3=c3, EH=(EH[idx[0]], EH[idx[1]]), out=out)
@@ -5,16 +5,14 @@ import numpy
 
 
 def get_mode_beta(fiber, mode_list: list, itr_list: list):
-    data_dict = {}
-    for mode in mode_list:
-        data_list = []
-        for j, itr in enumerate(itr_list):
-            _fiber = fiber.scale(factor=itr)
+    mode_dict = {mode.__repr__(): mode for mode in mode_list}  # Repeated modes are solved once
+    data_dict = {mode_name: [] for mode_name in mode_dict}
+    for itr in itr_list:
+        _fiber = fiber.scale(factor=itr)
+        for mode_name, mode in mode_dict.items():
             neff = _fiber.get_effective_index(mode=mode)
-            data_list.append(neff)
+            data_dict[mode_name].append(neff)
 
-        data_dict[mode.__repr__()] = numpy.asarray(data_list)
-
-    return data_dict
+    return {mode: numpy.asarray(data_list) for mode, data_list in data_dict.items()}
 
 # -
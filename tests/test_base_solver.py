@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy
+
+from PyFiberModes.solver.base_solver import BaseSolver
+
+
+def linear(x):
+    return x - 1.0
+
+
+scan_list = [
+    dict(function=numpy.sin, lowbound=0.1, delta=0.3, maxiter=100),
+    dict(function=numpy.tan, lowbound=0.1, highbound=10, delta=0.3),
+    dict(function=numpy.cos, lowbound=0.1, highbound=10, delta=0.3),
+    dict(function=numpy.cos, lowbound=5, highbound=0.5, delta=-0.3),
+    dict(function=numpy.cos, lowbound=0.1, highbound=1.2, delta=0.1),
+    dict(function=numpy.sin, lowbound=1, ipoints=[2., 3., 4., 5.], delta=0.5),
+    dict(function=numpy.tan, lowbound=1, ipoints=[1.2, 1.7, 2.5, 3.3], delta=0.5),
+    dict(function=linear, lowbound=0, delta=0.25, maxiter=20),
+    dict(function=numpy.sin, lowbound=0, delta=0.25, maxiter=20),
+]
+
+scan_ids = [
+    "first_root",
+    "discontinuity_ascending",
+    "ascending_highbound",
+    "descending_highbound",
+    "no_root_before_highbound",
+    "ipoints",
+    "ipoints_discontinuity",
+    "exact_zero_on_grid",
+    "exact_zero_at_lowbound",
+]
+
+
+@pytest.mark.parametrize('kwargs', scan_list, ids=scan_ids)
+def test_find_function_first_root_vectorized(kwargs):
+    solver = BaseSolver(fiber=None, wavelength=None)
+
+    serial_root = solver.find_function_first_root(**kwargs)
+    vectorized_root = solver.find_function_first_root(**kwargs, vectorized=True)
+
+    assert numpy.isclose(serial_root, vectorized_root, equal_nan=True), \
+        f"Vectorized root {vectorized_root} do not match serial root {serial_root}."
+
+
+def test_find_function_first_root_skips_discontinuity():
+    solver = BaseSolver(fiber=None, wavelength=None)
+
+    root = solver.find_function_first_root(numpy.tan, lowbound=0.1, highbound=10, delta=0.3, vectorized=True)
+
+    assert numpy.isclose(root, numpy.pi), "The pole of tan at pi / 2 should not be returned as a root."
+
+
+def tan_undefined_near_pole(x):
+    return numpy.where(abs(x - numpy.pi / 2) < 0.1, numpy.nan, numpy.tan(x))
+
+
+@pytest.mark.parametrize('vectorized', [False, True], ids=['serial', 'vectorized'])
+def test_find_function_first_root_skips_nan_bracket(vectorized):
+    solver = BaseSolver(fiber=None, wavelength=None)
+
+    root = solver.find_function_first_root(
+        tan_undefined_near_pole,
+        lowbound=0.2,
+        highbound=10,
+        delta=0.3,
+        vectorized=vectorized
+    )
+
+    assert numpy.isclose(root, numpy.pi), "A bracket with NaN values should be skipped, not end the scan."
+
+
+def tan_failing_near_pole(x):
+    if numpy.any(abs(numpy.asarray(x) - numpy.pi / 2) < 0.1):
+        raise ValueError("Evaluation error within the dispersion equation")
+    return numpy.tan(x)
+
+
+@pytest.mark.parametrize('vectorized', [False, True], ids=['serial', 'vectorized'])
+def test_find_function_first_root_raises_function_error(vectorized):
+    solver = BaseSolver(fiber=None, wavelength=None)
+
+    with pytest.raises(ValueError):
+        solver.find_function_first_root(
+            tan_failing_near_pole,
+            lowbound=0.2,
+            highbound=10,
+            delta=0.3,
+            vectorized=vectorized
+        )
+
+
+range_list = [
+    dict(function=numpy.cos, x_low=0.1, x_high=3),
+    dict(function=numpy.cos, x_low=3, x_high=0.1),
+    dict(function=numpy.cos, x_low=2, x_high=4),
+]
+
+
+@pytest.mark.parametrize('kwargs', range_list, ids=["ascending", "descending", "no_root"])
+def test_find_root_within_range_vectorized(kwargs):
+    solver = BaseSolver(fiber=None, wavelength=None)
+
+    serial_boundaries = solver.get_new_x_low_x_high(**kwargs, function_args=())
+    vectorized_boundaries = solver.get_new_x_low_x_high(**kwargs, function_args=(), vectorized=True)
+
+    assert numpy.allclose(serial_boundaries, vectorized_boundaries, equal_nan=True)
+
+    serial_root = solver.find_root_within_range(**kwargs)
+    vectorized_root = solver.find_root_within_range(**kwargs, vectorized=True)
+
+    assert numpy.isclose(serial_root, vectorized_root, equal_nan=True), \
+        f"Vectorized root {vectorized_root} do not match serial root {serial_root}."
+
+# -
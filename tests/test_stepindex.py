@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy
+from scipy.special import jn, jvp, yn, yvp, iv, ivp, kn, kvp, j0, j1, y0, y1, i0, i1, k0, k1
+from scipy.constants import mu_0, epsilon_0, physical_constants
+
+from PyFiberModes.stepindex import StepIndex, solve_V_system, solve_TE_TM_system, get_EH_from_constants
+from PyFiberModes.wavelength import Wavelength
+
+eta0 = physical_constants['characteristic impedance of vacuum'][0]
+Y0 = numpy.sqrt(epsilon_0 / mu_0)
+
+
+def get_V_matrix(F1, F2, F3, F4, c2, c3, c4):
+    return numpy.array([
+        [F1, F2, 0, 0],
+        [0, 0, F1, F2],
+        [F1 * c2, F2 * c2, -F3 * c3, -F4 * c3],
+        [F3 * c4, F4 * c4, -F1 * c2, -F2 * c2]
+    ])
+
+
+@pytest.mark.parametrize('shape', [(4,), (4, 2)], ids=['TE_TM', 'hybrid'])
+@pytest.mark.parametrize('seed', range(5))
+def test_solve_V_system(shape, seed):
+    random = numpy.random.default_rng(seed)
+    F1, F2, F3, F4, c2, c3, c4 = random.uniform(-2, 2, 7)
+    EH = random.uniform(-2, 2, shape)
+
+    C = solve_V_system(F1=F1, F2=F2, F3=F3, F4=F4, c2=c2, c3=c3, c4=c4, EH=EH)
+    reference = numpy.linalg.solve(get_V_matrix(F1, F2, F3, F4, c2, c3, c4), EH)
+
+    assert C.shape == EH.shape
+    assert numpy.allclose(C, reference, rtol=1e-10, atol=0)
+
+    out = numpy.empty(shape)
+    solve_V_system(F1=F1, F2=F2, F3=F3, F4=F4, c2=c2, c3=c3, c4=c4, EH=EH, out=out)
+    assert numpy.array_equal(out, C)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_solve_TE_TM_system(seed):
+    random = numpy.random.default_rng(seed)
+    F1, F2, F3, F4, c3 = random.uniform(-2, 2, 5)
+    EH = random.uniform(-2, 2, 2)
+
+    C = solve_TE_TM_system(F1=F1, F2=F2, F3=F3, F4=F4, c3=c3, EH=EH)
+    reference = numpy.linalg.solve([[F1, F2], [F3 * c3, F4 * c3]], EH)
+
+    assert numpy.allclose(C, reference, rtol=1e-10, atol=0)
+
+
+@pytest.mark.parametrize('shape', [(4,), (4, 2)], ids=['TE_TM', 'hybrid'])
+def test_get_EH_from_constants(shape):
+    random = numpy.random.default_rng(0)
+    F3, F4, c2, c3, c4 = random.uniform(-2, 2, 5)
+    C = random.uniform(-2, 2, shape)
+
+    EH = get_EH_from_constants(C=C, F3=F3, F4=F4, c2=c2, c3=c3, c4=c4, EH=numpy.empty(shape))
+
+    assert numpy.allclose(EH[0], C[0] + C[1])
+    assert numpy.allclose(EH[1], C[2] + C[3])
+    assert numpy.allclose(EH[2], c2 * (C[0] + C[1]) - c3 * (F3 * C[2] + F4 * C[3]))
+    assert numpy.allclose(EH[3], c4 * (F3 * C[0] + F4 * C[1]) - c2 * (C[2] + C[3]))
+
+
+def get_reference_EH_fields(layer, radius_in, radius_out, nu, neff, EH, TM):
+    """ Direct evaluation of the layer fields with scipy Bessel functions and numpy.linalg.solve """
+    k = layer.wavelength.k0
+    n = layer.refractive_index
+    u = k * radius_out * numpy.sqrt(abs(n**2 - neff**2))
+    urp = k * radius_in * numpy.sqrt(abs(n**2 - neff**2))
+    sign = 1 if neff < n else -1
+    c1 = sign * k * radius_out / u
+
+    if radius_in == 0:
+        if nu == 0:
+            C = numpy.array([1., 0., 0., 0.]) if TM else numpy.array([0., 0., 1., 0.])
+        else:
+            C = numpy.zeros((4, 2))
+            C[0, 0] = C[2, 1] = 1
+
+    elif nu == 0:
+        if neff < n:
+            F1, F2, F3, F4 = j0(urp) / j0(u), y0(urp) / y0(u), -j1(urp) / j0(u), -y1(urp) / y0(u)
+        else:
+            F1, F2, F3, F4 = i0(urp) / i0(u), k0(urp) / k0(u), i1(urp) / i0(u), -k1(urp) / k0(u)
+
+        c3 = (Y0 * n**2 if TM else -eta0) * c1
+        idx = (0, 3) if TM else (1, 2)
+        C = numpy.zeros(4)
+        C[slice(0, 2) if TM else slice(2, 4)] = numpy.linalg.solve([[F1, F2], [F3 * c3, F4 * c3]], EH.take(idx))
+
+    else:
+        if neff < n:
+            B1, B2 = jn(nu, u), yn(nu, u)
+            F1, F2, F3, F4 = jn(nu, urp) / B1, yn(nu, urp) / B2, jvp(nu, urp) / B1, yvp(nu, urp) / B2
+        else:
+            B1, B2 = iv(nu, u), kn(nu, u)
+            F1, F2, F3, F4 = iv(nu, urp) / B1, kn(nu, urp) / B2, ivp(nu, urp) / B1, kvp(nu, urp) / B2
+
+        a = get_V_matrix(F1, F2, F3, F4, neff * nu / urp * c1, eta0 * c1, Y0 * n**2 * c1)
+        C = numpy.linalg.solve(a, EH)
+
+    if neff < n:
+        F3, F4 = jvp(nu, u) / jn(nu, u), yvp(nu, u) / yn(nu, u)
+    else:
+        F3, F4 = ivp(nu, u) / iv(nu, u), kvp(nu, u) / kn(nu, u)
+
+    c2 = neff * nu / u * c1
+    c3 = eta0 * c1
+    c4 = Y0 * n**2 * c1
+
+    return numpy.array([
+        C[0] + C[1],
+        C[2] + C[3],
+        c2 * (C[0] + C[1]) - c3 * (F3 * C[2] + F4 * C[3]),
+        c4 * (F3 * C[0] + F4 * C[1]) - c2 * (C[2] + C[3])
+    ])
+
+
+field_list = [
+    dict(radius_in=0, nu=0, neff=1.446, TM=True),
+    dict(radius_in=0, nu=0, neff=1.446, TM=False),
+    dict(radius_in=0, nu=1, neff=1.446, TM=True),
+    dict(radius_in=0, nu=2, neff=1.452, TM=True),
+    dict(radius_in=4e-6, nu=0, neff=1.446, TM=True),
+    dict(radius_in=4e-6, nu=0, neff=1.446, TM=False),
+    dict(radius_in=4e-6, nu=0, neff=1.452, TM=False),
+    dict(radius_in=4e-6, nu=1, neff=1.446, TM=True),
+    dict(radius_in=4e-6, nu=3, neff=1.452, TM=True),
+]
+
+field_ids = [
+    "core_TM", "core_TE", "core_HE1", "core_evanescent_HE2",
+    "ring_TM", "ring_TE", "ring_evanescent_TE", "ring_HE1", "ring_evanescent_HE3"
+]
+
+
+@pytest.mark.parametrize('kwargs', field_list, ids=field_ids)
+def test_EH_fields(kwargs):
+    layer = StepIndex(radius_in=kwargs['radius_in'], radius_out=20e-6, index_list=[1.45])
+    layer.wavelength = Wavelength(1550e-9)
+
+    shape = (4,) if kwargs['nu'] == 0 else (4, 2)
+    EH_in = numpy.random.default_rng(0).uniform(-1, 1, shape)
+
+    reference = get_reference_EH_fields(layer=layer, radius_out=20e-6, EH=EH_in.copy(), **kwargs)
+
+    # Evaluated twice to check that the reused constants buffers are not stale
+    for _ in range(2):
+        EH = layer.EH_fields(radius_out=20e-6, EH=EH_in.copy(), **kwargs)
+
+        assert numpy.allclose(EH, reference, rtol=1e-9, atol=0), "EH fields do not match direct evaluation."
+
+# -
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy
+
+from PyFiberModes.tools.utils import get_mode_beta
+from PyFiberModes import LP01, LP11
+
+
+class ScalableFiber():
+    """ Minimal fiber returning its scaling factor as effective index """
+    def __init__(self, factor: float = 1):
+        self.factor = factor
+
+    def scale(self, factor: float):
+        return ScalableFiber(factor=self.factor * factor)
+
+    def get_effective_index(self, mode):
+        return self.factor
+
+
+def test_get_mode_beta_repeated_mode():
+    itr_list = numpy.linspace(1.0, 0.3, 3)
+
+    data_dict = get_mode_beta(fiber=ScalableFiber(), mode_list=[LP01, LP11, LP01], itr_list=itr_list)
+
+    assert list(data_dict.keys()) == ['LP01', 'LP11']
+
+    for mode_name, data in data_dict.items():
+        assert len(data) == len(itr_list), f"Mode {mode_name} should have one value per ITR."
+        assert numpy.allclose(data, itr_list)
+
+# -
@@ -42,4 +42,30 @@ def test_2_3_layer_solver():
     assert discrepencies.all()
 
 
+def test_3_layer_effective_index():
+    """ Reference values from the 3-layer solver with numpy.linalg.solve and direct scipy Bessel evaluations """
+    fiber = load_fiber(fiber_name='SMF28', wavelength=1550e-9, add_air_layer=True)
+
+    reference_list = [
+        (1.0, HE11, 1.4508707010322413),
+        (1.0, HE21, 1.4459464944294218),
+        (0.5, HE11, 1.4466760177754119),
+        (0.5, HE21, 1.4445588441904018),
+        (0.5, TE01, 1.4445600926172413),
+    ]
+
+    for itr, mode, reference in reference_list:
+        neff = fiber.scale(itr).get_effective_index(mode=mode)
+        assert numpy.isclose(neff, reference, rtol=1e-9, atol=0), f"Mode {mode} effective index at ITR {itr} do not match reference."
+
+
+def test_3_layer_TE01_past_pole():
+    """ The TE01 scan crosses a pole of the TE equation where it evaluates to NaN before reaching the root """
+    fiber = load_fiber(fiber_name='SMF28', wavelength=1550e-9, add_air_layer=True)
+
+    neff_TE01 = fiber.get_effective_index(mode=TE01)
+
+    assert numpy.isclose(neff_TE01, 1.4459669028914135, rtol=1e-9, atol=0), "TE01 effective index at ITR 1.0 do not match reference."
+
+
 # -